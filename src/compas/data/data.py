@@ -132,10 +132,19 @@ class Data(object):
     def __getstate__(self):
         state = self.__jsondump__()
         state["__dict__"] = self.__dict__
+        slots = {}
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    slots[name] = getattr(self, name)
+        if slots:
+            state["__slots__"] = slots
         return state
 
     def __setstate__(self, state):
         self.__dict__.update(state["__dict__"])
+        for name, value in state.get("__slots__", {}).items():
+            setattr(self, name, value)
         if "guid" in state:
             self._guid = UUID(state["guid"])
         if "name" in state:
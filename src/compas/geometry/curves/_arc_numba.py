@@ -0,0 +1,29 @@
+from math import cos
+from math import sin
+
+from numpy import empty
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _arc_points(ts, start_angle, angle, radius, R, t):
+    # sampling and transformation to world coordinates are fused into a single loop
+    # to avoid the temporary arrays of the equivalent numpy expressions
+    points = empty((ts.shape[0], 3))
+    for i in range(ts.shape[0]):
+        a = start_angle + ts[i] * angle
+        x = radius * cos(a)
+        y = radius * sin(a)
+        points[i, 0] = R[0, 0] * x + R[0, 1] * y + t[0]
+        points[i, 1] = R[1, 0] * x + R[1, 1] * y + t[1]
+        points[i, 2] = R[2, 0] * x + R[2, 1] * y + t[2]
+    return points
+
+
+if njit:
+    arc_points_numba = njit(cache=True, fastmath=True)(_arc_points)
+else:
+    arc_points_numba = None
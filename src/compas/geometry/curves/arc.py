@@ -113,6 +113,15 @@ class Arc(Curve):
 
     """
 
+    __slots__ = (
+        "_radius",
+        "_start_angle",
+        "_end_angle",
+        "_angle",
+        "_length",
+        "_circumference",
+    )
+
     # overwriting the __new__ method is necessary
     # to avoid triggering the plugin mechanism of the base curve class
     def __new__(cls, *args, **kwargs):
@@ -156,6 +165,9 @@ class Arc(Curve):
         self._radius = None
         self._start_angle = None
         self._end_angle = None
+        self._angle = None
+        self._length = None
+        self._circumference = None
         self.radius = radius
         self.start_angle = start_angle
         self.end_angle = end_angle
@@ -195,6 +207,8 @@ class Arc(Curve):
         if value < 0.0:
             raise ValueError("Radius must be greater than or equal to zero.")
         self._radius = value
+        self._length = None
+        self._circumference = None
 
     @property
     def start_angle(self):
@@ -204,9 +218,11 @@ class Arc(Curve):
 
     @start_angle.setter
     def start_angle(self, value):
-        if value < 0.0 or value > PI2:
+        if not 0.0 <= value <= PI2:
             raise ValueError("Start angle must satisfy 0 <= angle <= 2 * pi.")
         self._start_angle = value
+        self._angle = None
+        self._length = None
 
     @property
     def end_angle(self):
@@ -216,9 +232,11 @@ class Arc(Curve):
 
     @end_angle.setter
     def end_angle(self, value):
-        if value < 0.0 or value > PI2:
+        if not 0.0 <= value <= PI2:
             raise ValueError("End angle must satisfy 0 <= angle <= 2 * pi.")
         self._end_angle = value
+        self._angle = None
+        self._length = None
 
     @property
     def circle(self):
@@ -230,11 +248,15 @@ class Arc(Curve):
 
     @property
     def length(self):
-        return self.radius * self.angle
+        if self._length is None:
+            self._length = self.radius * self.angle
+        return self._length
 
     @property
     def angle(self):
-        return self.end_angle - self.start_angle
+        if self._angle is None:
+            self._angle = self.end_angle - self.start_angle
+        return self._angle
 
     @property
     def diameter(self):
@@ -242,7 +264,9 @@ class Arc(Curve):
 
     @property
     def circumference(self):
-        return self.diameter * pi
+        if self._circumference is None:
+            self._circumference = self.diameter * pi
+        return self._circumference
 
     @property
     def is_circle(self):
@@ -257,8 +281,9 @@ class Arc(Curve):
         return False
 
     def _verify(self):
-        if self.angle < 0.0 or self.angle > PI2:
-            raise ValueError("Sweep angle must satisfy 0 < angle < 2 * Pi. Currently:{}".format(self.angle))
+        angle = self.angle
+        if not 0.0 <= angle <= PI2:
+            raise ValueError("Sweep angle must satisfy 0 < angle < 2 * Pi. Currently:{}".format(angle))
 
     # =============================================================================
     # Constructors
@@ -344,6 +369,81 @@ class Arc(Curve):
 
         return self.frame.point + self.frame.xaxis * x + self.frame.yaxis * y
 
+    def points_at(self, ts, world=True):
+        """Returns the points at the specified parameters, computed with NumPy.
+
+        Parameters
+        ----------
+        ts : float | sequence[float]
+            The parameters at which to evaluate the arc.
+            A single parameter, or nested sequences of parameters, are flattened into a sequence of N parameters.
+        world : bool, optional
+            If ``True``, the points are returned in world coordinates.
+
+        Returns
+        -------
+        (N, 3) ndarray
+            The XYZ coordinates of the points.
+
+        Raises
+        ------
+        ValueError
+            If any of the parameters is not in the domain of the curve ``[0, 1]``.
+
+        See Also
+        --------
+        :meth:`point_at`
+
+        Notes
+        -----
+        This is the vectorized equivalent of :meth:`point_at`.
+        All parameters are evaluated in one pass over an array,
+        and the result is mapped to the world coordinate system with a single matrix product.
+        The rotation matrix and translation vector are taken from the current frame of the arc on every call.
+
+        If `numba` is installed, the evaluation in world coordinates is done by a compiled kernel
+        that combines sampling and transformation in a single loop over the parameters.
+
+        Examples
+        --------
+        >>> from math import pi
+        >>> arc = Arc(radius=1.0, start_angle=0.0, end_angle=pi)
+        >>> points = arc.points_at([0.0, 0.5, 1.0])
+        >>> points.shape
+        (3, 3)
+
+        """
+        from numpy import asarray
+        from numpy import atleast_1d
+        from numpy import column_stack
+        from numpy import cos
+        from numpy import sin
+        from numpy import zeros_like
+
+        from ._arc_numba import arc_points_numba
+
+        ts = atleast_1d(asarray(ts, dtype=float)).ravel()
+        if ts.size and (ts.min() < 0.0 or ts.max() > 1.0):
+            raise ValueError("Parameter t should be between 0.0 and 1.0")
+
+        if world:
+            frame = self.frame
+            R = column_stack((frame.xaxis, frame.yaxis, frame.zaxis))
+            t = asarray(frame.point, dtype=float)
+
+            if arc_points_numba:
+                return arc_points_numba(ts, float(self.start_angle), float(self.angle), float(self.radius), R, t)
+
+        angles = self.start_angle + ts * self.angle
+        x = self.radius * cos(angles)
+        y = self.radius * sin(angles)
+        xyz = column_stack((x, y, zeros_like(x)))
+
+        if not world:
+            return xyz
+
+        return xyz.dot(R.T) + t
+
     def normal_at(self, t, world=True):
         """Construct a normal vector to the arc at a specific parameter.
 
@@ -2,14 +2,10 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+from math import sqrt
+
 from compas.tolerance import TOL
 
-from compas.geometry import quaternion_multiply
-from compas.geometry import quaternion_conjugate
-from compas.geometry import quaternion_unitize
-from compas.geometry import quaternion_canonize
-from compas.geometry import quaternion_norm
-from compas.geometry import quaternion_is_unit
 from compas.geometry import quaternion_from_matrix
 from compas.geometry import Geometry
 
@@ -42,8 +38,10 @@ class Quaternion(Geometry):
         The Z component of the quaternion.
     wxyz : list[float], read-only
         Quaternion as a list of float in the 'wxyz' convention.
+        This is the layout expected by the rows of the arrays of :meth:`multiply_batch` and :meth:`unitize_batch`.
     xyzw : list[float], read-only
         Quaternion as a list of float in the 'xyzw' convention.
+        This is the scalar-last layout used, for example, by :mod:`scipy.spatial.transform`.
     norm : float, read-only
         The length (euclidean norm) of the quaternion.
     is_unit : bool, read-only
@@ -116,6 +114,8 @@ class Quaternion(Geometry):
 
     """
 
+    __slots__ = ("_w", "_x", "_y", "_z")
+
     DATASCHEMA = {
         "type": "object",
         "properties": {
@@ -226,11 +226,12 @@ class Quaternion(Geometry):
 
     @property
     def norm(self):
-        return quaternion_norm(self)
+        w, x, y, z = self.w, self.x, self.y, self.z
+        return sqrt(w * w + x * x + y * y + z * z)
 
     @property
     def is_unit(self):
-        return quaternion_is_unit(self)
+        return TOL.is_close(self.norm, 1.0, rtol=0.0)
 
     # ==========================================================================
     # Operators
@@ -265,8 +266,17 @@ class Quaternion(Geometry):
         True
 
         """
-        p = quaternion_multiply(list(self), list(other))
-        return Quaternion(*p)
+        rw, rx, ry, rz = self.w, self.x, self.y, self.z
+        if isinstance(other, Quaternion):
+            qw, qx, qy, qz = other.w, other.x, other.y, other.z
+        else:
+            qw, qx, qy, qz = other
+        return Quaternion(
+            rw * qw - rx * qx - ry * qy - rz * qz,
+            rw * qx + rx * qw + ry * qz - rz * qy,
+            rw * qy - rx * qz + ry * qw + rz * qx,
+            rw * qz + rx * qy - ry * qx + rz * qw,
+        )
 
     # ==========================================================================
     # Constructors
@@ -289,6 +299,8 @@ class Quaternion(Geometry):
         --------
         >>> from compas.geometry import allclose
         >>> from compas.geometry import Frame
+        >>> from compas.geometry import quaternion_canonize
+        >>> from compas.geometry import quaternion_unitize
         >>> q = [1., -2., 3., -4.]
         >>> F = Frame.from_quaternion(q)
         >>> Q = Quaternion.from_frame(F)
@@ -350,6 +362,93 @@ class Quaternion(Geometry):
     # Methods
     # ==========================================================================
 
+    @staticmethod
+    def multiply_batch(A, B):
+        """Multiply two arrays of quaternions element-wise using NumPy.
+
+        Parameters
+        ----------
+        A : array-like
+            An array of quaternions of shape (N, 4), in the 'wxyz' convention.
+        B : array-like
+            An array of quaternions of shape (N, 4), in the 'wxyz' convention.
+
+        Returns
+        -------
+        (N, 4) ndarray
+            The products :math:`P_i = A_i * B_i`, in the 'wxyz' convention.
+
+        See Also
+        --------
+        :meth:`__mul__`, :meth:`unitize_batch`
+
+        Examples
+        --------
+        >>> from compas.geometry import allclose
+        >>> Q = Quaternion(1.0, 1.0, 1.0, 1.0).unitized()
+        >>> R = Quaternion(0.0,-0.1, 0.2,-0.3).unitized()
+        >>> P = Quaternion.multiply_batch([R.wxyz, Q.wxyz], [Q.wxyz, R.wxyz])
+        >>> allclose(P[0], R * Q) and allclose(P[1], Q * R)
+        True
+
+        """
+        from numpy import asarray
+        from numpy import stack
+
+        A = asarray(A, dtype=float)
+        B = asarray(B, dtype=float)
+        rw, rx, ry, rz = A[..., 0], A[..., 1], A[..., 2], A[..., 3]
+        qw, qx, qy, qz = B[..., 0], B[..., 1], B[..., 2], B[..., 3]
+        return stack(
+            (
+                rw * qw - rx * qx - ry * qy - rz * qz,
+                rw * qx + rx * qw + ry * qz - rz * qy,
+                rw * qy - rx * qz + ry * qw + rz * qx,
+                rw * qz + rx * qy - ry * qx + rz * qw,
+            ),
+            axis=-1,
+        )
+
+    @staticmethod
+    def unitize_batch(Q):
+        """Scale an array of quaternions to unit-length using NumPy.
+
+        Parameters
+        ----------
+        Q : array-like
+            An array of quaternions of shape (N, 4).
+
+        Returns
+        -------
+        (N, 4) ndarray
+            The unit-length quaternions.
+
+        Raises
+        ------
+        ValueError
+            If any of the quaternions has (almost) zero length.
+
+        See Also
+        --------
+        :meth:`unitize`, :meth:`multiply_batch`
+
+        Examples
+        --------
+        >>> Q = Quaternion.unitize_batch([[1.0, 1.0, 1.0, 1.0], [0.0, 0.0, 0.0, 2.0]])
+        >>> Q.tolist()
+        [[0.5, 0.5, 0.5, 0.5], [0.0, 0.0, 0.0, 1.0]]
+
+        """
+        from numpy import asarray
+        from numpy import einsum
+        from numpy import sqrt
+
+        Q = asarray(Q, dtype=float)
+        n = sqrt(einsum("...i,...i->...", Q, Q))
+        if (n <= TOL.absolute).any():
+            raise ValueError("The given quaternions contain a quaternion with zero length.")
+        return Q / n[..., None]
+
     def unitize(self):
         """Scales the quaternion to make it unit-length.
 
@@ -367,8 +466,10 @@ class Quaternion(Geometry):
         True
 
         """
-        qu = quaternion_unitize(self)
-        self.w, self.x, self.y, self.z = qu
+        n = self.norm
+        if TOL.is_zero(n):
+            raise ValueError("The given quaternion has zero length.")
+        self.w, self.x, self.y, self.z = self.w / n, self.x / n, self.y / n, self.z / n
 
     def unitized(self):
         """Returns a quaternion with a unit-length.
@@ -387,8 +488,10 @@ class Quaternion(Geometry):
         True
 
         """
-        qu = quaternion_unitize(self)
-        return Quaternion(*qu)
+        n = self.norm
+        if TOL.is_zero(n):
+            raise ValueError("The given quaternion has zero length.")
+        return Quaternion(self.w / n, self.x / n, self.y / n, self.z / n)
 
     def canonize(self):
         """Makes the quaternion canonic.
@@ -408,8 +511,8 @@ class Quaternion(Geometry):
         Quaternion(0.500, -0.500, -0.500, -0.500)
 
         """
-        qc = quaternion_canonize(self)
-        self.w, self.x, self.y, self.z = qc  # type: ignore
+        if self.w < 0.0:
+            self.w, self.x, self.y, self.z = -self.w, -self.x, -self.y, -self.z
 
     def canonized(self):
         """Returns a quaternion in canonic form.
@@ -430,8 +533,9 @@ class Quaternion(Geometry):
         Quaternion(0.500, -0.500, -0.500, -0.500)
 
         """
-        qc = quaternion_canonize(self)
-        return Quaternion(*qc)  # type: ignore
+        if self.w < 0.0:
+            return Quaternion(-self.w, -self.x, -self.y, -self.z)
+        return Quaternion(self.w, self.x, self.y, self.z)
 
     def conjugate(self):
         """Conjugate the quaternion.
@@ -448,8 +552,7 @@ class Quaternion(Geometry):
         Quaternion(1.000, -1.000, -1.000, -1.000)
 
         """
-        qc = quaternion_conjugate(self)
-        self.w, self.x, self.y, self.z = qc
+        self.x, self.y, self.z = -self.x, -self.y, -self.z
 
     def conjugated(self):
         """Returns a conjugate quaternion.
@@ -469,5 +572,4 @@ class Quaternion(Geometry):
         Quaternion(1.000, -1.000, -1.000, -1.000)
 
         """
-        qc = quaternion_conjugate(self)
-        return Quaternion(*qc)
+        return Quaternion(self.w, -self.x, -self.y, -self.z)
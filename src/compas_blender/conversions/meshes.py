@@ -1,9 +1,9 @@
 from typing import Optional
 
+import numpy
 import bpy  # type: ignore
 import bmesh  # type: ignore
 
-from compas.geometry import Translation
 from compas.datastructures import Mesh
 
 # To Do
@@ -68,6 +68,46 @@ def vertices_and_faces_to_blender_mesh(
 # =============================================================================
 
 
+def _vertices_coordinates(m: bpy.types.Mesh, offset=None) -> numpy.ndarray:
+    # read all vertex coordinates with a single RNA call
+    # instead of accessing the ``co`` attribute of every vertex separately
+    n = len(m.vertices)
+    xyz = numpy.empty(3 * n, dtype=numpy.float32)
+    m.vertices.foreach_get("co", xyz)
+    xyz = xyz.reshape((n, 3))
+    if offset is not None:
+        xyz += numpy.asarray(offset, dtype=numpy.float32)
+    return xyz
+
+
+def _loops_vertices(m: bpy.types.Mesh) -> numpy.ndarray:
+    n = len(m.loops)
+    indices = numpy.empty(n, dtype=numpy.int32)
+    m.loops.foreach_get("vertex_index", indices)
+    return indices
+
+
+def _faces_vertices(m: bpy.types.Mesh, loops: numpy.ndarray) -> dict:
+    # slice the vertex indices of the loops per polygon
+    # instead of accessing the ``vertices`` attribute of every polygon separately
+    n = len(m.polygons)
+    start = numpy.empty(n, dtype=numpy.int32)
+    total = numpy.empty(n, dtype=numpy.int32)
+    m.polygons.foreach_get("loop_start", start)
+    m.polygons.foreach_get("loop_total", total)
+    indices = loops.tolist()
+    return {face: indices[i : i + t] for face, (i, t) in enumerate(zip(start.tolist(), total.tolist()))}
+
+
+def _mesh_to_compas(m: bpy.types.Mesh, name=None, offset=None) -> Mesh:
+    loops = _loops_vertices(m)
+    vertices = _vertices_coordinates(m, offset=offset).tolist()
+    faces = _faces_vertices(m, loops)
+    mesh = Mesh.from_vertices_and_faces(vertices, faces)
+    mesh.name = name
+    return mesh
+
+
 def mesh_to_compas(m: bpy.types.Mesh, name=None) -> Mesh:
     """Convert a Blender mesh to a COMPAS mesh.
 
@@ -82,11 +122,7 @@ def mesh_to_compas(m: bpy.types.Mesh, name=None) -> Mesh:
         A COMPAS mesh.
 
     """
-    vertices = [vertex.co for vertex in m.vertices]
-    faces = [face.vertices for face in m.polygons]
-    mesh = Mesh.from_vertices_and_faces(vertices, faces)
-    mesh.name = name
-    return mesh
+    return _mesh_to_compas(m, name=name)
 
 
 def bmesh_to_compas(bm: bmesh.types.BMesh, name=None) -> Mesh:
@@ -142,7 +178,4 @@ def meshobj_to_compas(obj: bpy.types.Object) -> Mesh:
         A COMPAS mesh.
 
     """
-    mesh = mesh_to_compas(obj.data)
-    T = Translation.from_vector(obj.location)
-    mesh.transform(T)
-    return mesh
+    return _mesh_to_compas(obj.data, offset=obj.location)
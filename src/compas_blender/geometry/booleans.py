@@ -1,3 +1,4 @@
+import numpy
 import bpy  # type: ignore
 from compas.plugins import plugin
 
@@ -91,7 +92,11 @@ def _boolean_operation(A, B, method):
     graph = bpy.context.evaluated_depsgraph_get()
     C = A.evaluated_get(graph)
     D = bpy.data.meshes.new_from_object(C)
-    vertices = [list(vertex.co)[:] for vertex in D.vertices]
+    # blender stores vertex coordinates as single precision floats
+    # reading them into a buffer of the same type avoids conversion while copying
+    xyz = numpy.empty(3 * len(D.vertices), dtype=numpy.float32)
+    D.vertices.foreach_get("co", xyz)
+    vertices = xyz.reshape((-1, 3)).tolist()
     faces = [list(face.vertices)[:] for face in D.polygons]
     delete_object(A)
     delete_object(B)
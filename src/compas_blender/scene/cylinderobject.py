@@ -26,6 +26,24 @@ class CylinderObject(BlenderSceneObject, GeometryObject):
 
     def __init__(self, cylinder: Cylinder, **kwargs: Any):
         super().__init__(geometry=cylinder, **kwargs)
+        self._vertices_and_faces = None
+        self._vertices_and_faces_key = None
+
+    def _compute_vertices_and_faces(self, u: int) -> tuple[list[list[float]], list[list[int]]]:
+        # the tessellation only changes if the resolution or the shape of the cylinder changes
+        frame = self.geometry.frame
+        key = (
+            u,
+            self.geometry.radius,
+            self.geometry.height,
+            tuple(frame.point),
+            tuple(frame.xaxis),
+            tuple(frame.yaxis),
+        )
+        if key != self._vertices_and_faces_key:
+            self._vertices_and_faces = self.geometry.to_vertices_and_faces(u=u)
+            self._vertices_and_faces_key = key
+        return self._vertices_and_faces
 
     def draw(
         self,
@@ -59,7 +77,7 @@ class CylinderObject(BlenderSceneObject, GeometryObject):
         name = self.geometry.name
         color = Color.coerce(color) or self.color
 
-        vertices, faces = self.geometry.to_vertices_and_faces(u=u)
+        vertices, faces = self._compute_vertices_and_faces(u)
         mesh = conversions.vertices_and_faces_to_blender_mesh(vertices, faces, name=self.geometry.name)
         if shade_smooth:
             mesh.shade_smooth()
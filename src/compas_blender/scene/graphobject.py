@@ -6,11 +6,13 @@ from typing import Tuple
 from typing import Union
 
 import bpy  # type: ignore
+import mathutils  # type: ignore
 
 import compas_blender
 from compas.datastructures import Graph
 from compas.colors import Color
 from compas.geometry import Line
+from compas.geometry import Sphere
 
 from compas.scene import GraphObject as BaseSceneObject
 from .sceneobject import BlenderSceneObject
@@ -142,18 +144,29 @@ class GraphObject(BlenderSceneObject, BaseSceneObject):
 
         self.nodecolor = color
 
+        graphname = self.graph.name  # type: ignore
+        nodecolor = self.nodecolor
+        # the world transformation is applied to the objects by update_object
+        # therefore the nodes are placed with their untransformed coordinates
+        node_xyz = dict(zip(self.graph.nodes(), self.graph.nodes_attributes("xyz")))  # type: ignore
+
+        # tessellate the sphere only once
+        # and give every node a translated copy of the same mesh data
+        sphere = conversions.sphere_to_blender_mesh(Sphere(radius=radius), u=u, v=v)
+
         for node in nodes or self.graph.nodes():  # type: ignore
-            name = f"{self.graph.name}.node.{node}"  # type: ignore
-            color = self.nodecolor[node]  # type: ignore
-            point = self.graph.nodes_attributes("xyz")[node]  # type: ignore
-
-            # there is no such thing as a sphere data block
-            bpy.ops.mesh.primitive_uv_sphere_add(location=point, radius=radius, segments=u, ring_count=v)
-            obj = bpy.context.object
-            self.objects.append(obj)
-            self.update_object(obj, name=name, color=color, collection=collection)
+            name = f"{graphname}.node.{node}"
+            color = nodecolor[node]  # type: ignore
+            point = node_xyz[node]
+
+            mesh = sphere.copy()
+            mesh.transform(mathutils.Matrix.Translation(point))
+            obj = self.create_object(mesh, name=name)
+            self.update_object(obj, color=color, collection=collection)
             objects.append(obj)
 
+        bpy.data.meshes.remove(sphere)
+
         return objects
 
     def draw_edges(
@@ -183,12 +196,16 @@ class GraphObject(BlenderSceneObject, BaseSceneObject):
 
         self.edgecolor = color
 
+        graphname = self.graph.name  # type: ignore
+        edgecolor = self.edgecolor
+        # the world transformation is applied to the objects by update_object
+        # therefore the nodes are placed with their untransformed coordinates
+        node_xyz = dict(zip(self.graph.nodes(), self.graph.nodes_attributes("xyz")))  # type: ignore
+
         for u, v in edges or self.graph.edges():  # type: ignore
-            name = f"{self.graph.name}.edge.{u}-{v}"  # type: ignore
-            color = self.edgecolor[u, v]  # type: ignore
-            curve = conversions.line_to_blender_curve(
-                Line(self.graph.nodes_attributes("xyz")[u], self.graph.nodes_attributes("xyz")[v])
-            )
+            name = f"{graphname}.edge.{u}-{v}"
+            color = edgecolor[u, v]  # type: ignore
+            curve = conversions.line_to_blender_curve(Line(node_xyz[u], node_xyz[v]))
 
             obj = self.create_object(curve, name=name)
             self.update_object(obj, color=color, collection=collection)
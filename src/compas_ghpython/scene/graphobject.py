@@ -49,9 +49,10 @@ class GraphObject(GHSceneObject, BaseGraphObject):
 
         """
         points = []
+        node_xyz = self.node_xyz
 
         for node in nodes or self.graph.nodes():  # type: ignore
-            points.append(conversions.point_to_rhino(self.node_xyz[node]))
+            points.append(conversions.point_to_rhino(node_xyz[node]))
 
         return points
 
@@ -70,8 +71,9 @@ class GraphObject(GHSceneObject, BaseGraphObject):
 
         """
         lines = []
+        node_xyz = self.node_xyz
 
         for edge in edges or self.graph.edges():  # type: ignore
-            lines.append(conversions.line_to_rhino((self.node_xyz[edge[0]], self.node_xyz[edge[1]])))
+            lines.append(conversions.line_to_rhino((node_xyz[edge[0]], node_xyz[edge[1]])))
 
         return lines
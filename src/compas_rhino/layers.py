@@ -4,6 +4,8 @@ from __future__ import division
 
 from collections import deque
 
+import System  # type: ignore
+import Rhino  # type: ignore
 import rhinoscriptsyntax as rs  # type: ignore
 import scriptcontext as sc  # type: ignore
 
@@ -14,6 +16,9 @@ try:
 except AttributeError:
     purge_object = None
 
+# the maximum number of GUIDs passed to Rhino in a single call
+CHUNK_SIZE = 1024
+
 
 # ==============================================================================
 # helpers
@@ -40,16 +45,39 @@ def find_objects_on_layer(name, include_hidden=True, include_children=True):
     return to_delete
 
 
+def find_objects_on_layer_index(index, include_hidden=True, include_children=True):
+    layer = sc.doc.Layers.FindIndex(index)
+    if not layer or layer.IsDeleted:
+        return []
+    settings = Rhino.DocObjects.ObjectEnumeratorSettings()
+    settings.HiddenObjects = include_hidden
+    settings.IncludeLights = False
+    settings.IncludeGrips = False
+    settings.DeletedObjects = False
+    objects = []
+    to_visit = deque([layer])
+    while to_visit:
+        layer = to_visit.popleft()
+        settings.LayerIndexFilter = layer.Index
+        for obj in sc.doc.Objects.GetObjectList(settings):
+            if obj.IsHidden:
+                sc.doc.Objects.Show(obj, True)
+            objects.append(obj)
+        if include_children:
+            to_visit.extend(layer.GetChildren() or [])
+    return objects
+
+
 def delete_objects_on_layer(name, include_hidden=True, include_children=False, purge=True):
     guids = find_objects_on_layer(name, include_hidden, include_children)
     if purge and purge_object:
-        rs.EnableRedraw(False)
+        redraw = rs.EnableRedraw(False)
         for guid in guids:
             obj = find_object(guid)
             if not obj:
                 continue
             purge_object(obj.RuntimeSerialNumber)
-        rs.EnableRedraw(True)
+        rs.EnableRedraw(redraw)
     else:
         rs.DeleteObjects(guids)
 
@@ -190,9 +218,9 @@ def create_layers_from_dict(layers):
             if "layers" in attr:
                 recurse(attr["layers"], fullname)
 
-    rs.EnableRedraw(False)
+    redraw = rs.EnableRedraw(False)
     recurse(layers)
-    rs.EnableRedraw(True)
+    rs.EnableRedraw(redraw)
 
 
 create_layers = create_layers_from_dict
@@ -225,7 +253,7 @@ def clear_layer(name, include_hidden=True, include_children=True, purge=True):
     if not rs.IsLayer(name):
         return
     guids = find_objects_on_layer(name, include_hidden, include_children)
-    rs.EnableRedraw(False)
+    redraw = rs.EnableRedraw(False)
     if purge and purge_object:
         for guid in guids:
             obj = find_object(guid)
@@ -234,7 +262,75 @@ def clear_layer(name, include_hidden=True, include_children=True, purge=True):
             purge_object(obj.RuntimeSerialNumber)
     else:
         rs.DeleteObjects(guids)
-    rs.EnableRedraw(True)
+    rs.EnableRedraw(redraw)
+
+
+def clear_layer_by_index(index, include_hidden=True, include_children=True, purge=True):
+    """Delete all objects of a layer identified by its index in the layer table.
+
+    Parameters
+    ----------
+    index : int
+        The index of the layer.
+    include_hidden : bool, optional
+        If True, include all hidden objects.
+    include_children : bool, optional
+        If True, include the objects of child layers.
+    purge : bool, optional
+        If True, purge history after deleting.
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    In contrast to :func:`clear_layer`, the layer and its children don't have to be looked up by name,
+    and the objects are deleted directly instead of being looked up by their GUIDs first.
+
+    """
+    clear_layers_by_index([index], include_hidden, include_children, purge)
+
+
+def clear_layers_by_index(indices, include_hidden=True, include_children=True, purge=True):
+    """Delete the objects of multiple layers identified by their indices in the layer table.
+
+    Parameters
+    ----------
+    indices : list[int]
+        The indices of the layers.
+    include_hidden : bool, optional
+        If True, include all hidden objects.
+    include_children : bool, optional
+        If True, include the objects of child layers.
+    purge : bool, optional
+        If True, purge history after deleting.
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    The objects of all layers are collected first and then deleted in a single pass.
+    If `include_children` is True, the indices should not contain layers nested in other layers of the list,
+    since their objects would otherwise be collected twice.
+
+    """
+    objects = []
+    for index in indices:
+        objects += find_objects_on_layer_index(index, include_hidden, include_children)
+    if not objects:
+        return
+    redraw = rs.EnableRedraw(False)
+    if purge and purge_object:
+        for obj in objects:
+            purge_object(obj.RuntimeSerialNumber)
+    else:
+        guids = [obj.Id for obj in objects]
+        for i in range(0, len(guids), CHUNK_SIZE):
+            sc.doc.Objects.Delete(System.Array[System.Guid](guids[i : i + CHUNK_SIZE]), True)
+    rs.EnableRedraw(redraw)
 
 
 def clear_current_layer():
@@ -268,7 +364,7 @@ def clear_layers(layers, include_children=True, include_hidden=True, purge=True)
     None
 
     """
-    rs.EnableRedraw(False)
+    redraw = rs.EnableRedraw(False)
     to_delete = []
     for name in layers:
         if rs.IsLayer(name):
@@ -280,8 +376,9 @@ def clear_layers(layers, include_children=True, include_hidden=True, purge=True)
                 continue
             purge_object(obj.RuntimeSerialNumber)
     else:
-        rs.DeleteObjects(to_delete)
-    rs.EnableRedraw(True)
+        for i in range(0, len(to_delete), CHUNK_SIZE):
+            rs.DeleteObjects(to_delete[i : i + CHUNK_SIZE])
+    rs.EnableRedraw(redraw)
 
 
 # ==============================================================================
@@ -332,7 +429,7 @@ def delete_layers(layers):
                 recurse(attr["layers"], fullname)
             to_delete.append(fullname)
 
-    rs.EnableRedraw(False)
+    redraw = rs.EnableRedraw(False)
     recurse(layers)
 
     for layer in to_delete:
@@ -343,4 +440,4 @@ def delete_layers(layers):
 
             rs.PurgeLayer(layer)
 
-    rs.EnableRedraw(True)
+    rs.EnableRedraw(redraw)
@@ -105,7 +105,7 @@ def delete_object(guid, purge=None, redraw=True):
         If True, purge the object from history after deleting.
         If False, delete but don't purge.
     redraw : bool, optional
-        If True, redrawing will be enabled and enacted.
+        If True, redrawing will be enabled and enacted, unless it was disabled before the call.
         If False, redrawing will be disabled.
 
     Returns
@@ -133,7 +133,7 @@ def delete_objects(guids, purge=None, redraw=True):
         If True, purge the objects from history after deleting.
         If False, delete but don't purge.
     redraw : bool, optional
-        If True, redrawing will be enabled and enacted.
+        If True, redrawing will be enabled and enacted, unless it was disabled before the call.
         If False, redrawing will be disabled.
 
     Returns
@@ -146,12 +146,12 @@ def delete_objects(guids, purge=None, redraw=True):
     if purge and purge_object:
         purge_objects(guids, redraw=redraw)
     else:
-        rs.EnableRedraw(False)
+        enabled = rs.EnableRedraw(False)
         for guid in guids:
             if rs.IsObjectHidden(guid):
                 rs.ShowObject(guid)
         rs.DeleteObjects(guids)
-        if redraw:
+        if redraw and enabled:
             rs.EnableRedraw(True)
             sc.doc.Views.Redraw()
 
@@ -164,7 +164,7 @@ def purge_objects(guids, redraw=True):
     guids : list[System.Guid]
         Object identifiers.
     redraw : bool, optional
-        If True, redrawing will be enabled and enacted.
+        If True, redrawing will be enabled and enacted, unless it was disabled before the call.
         If False, redrawing will be disabled.
 
     Returns
@@ -174,14 +174,14 @@ def purge_objects(guids, redraw=True):
     """
     if not purge_object:
         raise RuntimeError("Cannot purge outside Rhino script context")
-    rs.EnableRedraw(False)
+    enabled = rs.EnableRedraw(False)
     for guid in guids:
         if rs.IsObject(guid):
             if rs.IsObjectHidden(guid):
                 rs.ShowObject(guid)
             o = find_object(guid)
             purge_object(o.RuntimeSerialNumber)
-    if redraw:
+    if redraw and enabled:
         rs.EnableRedraw(True)
         sc.doc.Views.Redraw()
 
@@ -34,6 +34,7 @@ from compas.datastructures import VolMesh
 
 import compas_rhino
 
+from .exceptions import RhinoGroupError
 from .sceneobject import RhinoSceneObject
 from .circleobject import RhinoCircleObject
 from .ellipseobject import RhinoEllipseObject
@@ -97,6 +98,7 @@ def register_scene_objects():
 
 
 __all__ = [
+    "RhinoGroupError",
     "RhinoSceneObject",
     "RhinoCircleObject",
     "RhinoEllipseObject",
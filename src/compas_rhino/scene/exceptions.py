@@ -0,0 +1,21 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+
+class RhinoGroupError(Exception):
+    """Exception that is raised when a group cannot be added to the Rhino document.
+
+    Parameters
+    ----------
+    name : str
+        The name of the group.
+
+    """
+
+    def __init__(self, name):
+        super(RhinoGroupError, self).__init__(name)
+        self.name = name
+
+    def __str__(self):
+        return "Failed to add group: {}".format(self.name)
@@ -86,8 +86,10 @@ class RhinoGraphObject(RhinoSceneObject, GraphObject):
 
         """
         self.clear()
-        guids = self.draw_nodes(nodes=self.show_nodes, color=self.nodecolor, group=self.group)
-        guids += self.draw_edges(edges=self.show_edges, color=self.edgecolor, group=self.group)
+        guids = self.draw_nodes(nodes=self.show_nodes, color=self.nodecolor)
+        guids += self.draw_edges(edges=self.show_edges, color=self.edgecolor)
+        if self.group:
+            self.add_to_group(self.group, guids)
         self._guids = guids
         return self.guids
 
@@ -115,10 +117,14 @@ class RhinoGraphObject(RhinoSceneObject, GraphObject):
         if nodes is True:
             nodes = list(self.graph.nodes())
 
+        graphname = self.graph.name  # type: ignore
+        nodecolor = self.nodecolor
+        node_xyz = self.node_xyz
+
         for node in nodes or self.graph.nodes():  # type: ignore
-            name = "{}.node.{}".format(self.graph.name, node)  # type: ignore
-            attr = self.compile_attributes(name=name, color=self.nodecolor[node])
-            geometry = point_to_rhino(self.node_xyz[node])
+            name = "{}.node.{}".format(graphname, node)
+            attr = self.compile_attributes(name=name, color=nodecolor[node])
+            geometry = point_to_rhino(node_xyz[node])
 
             guid = sc.doc.Objects.AddPoint(geometry, attr)
             guids.append(guid)
@@ -159,13 +165,17 @@ class RhinoGraphObject(RhinoSceneObject, GraphObject):
         if edges is True:
             edges = list(self.graph.edges())
 
+        graphname = self.graph.name  # type: ignore
+        edgecolor = self.edgecolor
+        node_xyz = self.node_xyz
+
         for edge in edges or self.graph.edges():  # type: ignore
             u, v = edge
 
-            color = self.edgecolor[edge]
-            name = "{}.edge.{}-{}".format(self.graph.name, u, v)  # type: ignore
+            color = edgecolor[edge]
+            name = "{}.edge.{}-{}".format(graphname, u, v)
             attr = self.compile_attributes(name=name, color=color, arrow=arrow)
-            geometry = line_to_rhino((self.node_xyz[u], self.node_xyz[v]))
+            geometry = line_to_rhino((node_xyz[u], node_xyz[v]))
 
             guid = sc.doc.Objects.AddLine(geometry, attr)
             guids.append(guid)
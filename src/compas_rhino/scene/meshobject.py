@@ -200,19 +200,19 @@ class RhinoMeshObject(RhinoSceneObject, MeshObject):
             geometry.Transform(transformation_to_rhino(self.worldtransformation))
 
             self._guid_mesh = sc.doc.Objects.AddMesh(geometry, attr)
-            if self.group:
-                self.add_to_group(self.group, [self._guid_mesh])
-
             self._guids.append(self._guid_mesh)
 
         elif self.show_faces:
-            self._guids += self.draw_faces(faces=self.show_faces, color=self.facecolor, group=self.group)
+            self._guids += self.draw_faces(faces=self.show_faces, color=self.facecolor)
 
         if self.show_vertices:
-            self._guids += self.draw_vertices(vertices=self.show_vertices, color=self.vertexcolor, group=self.group)
+            self._guids += self.draw_vertices(vertices=self.show_vertices, color=self.vertexcolor)
 
         if self.show_edges:
-            self._guids += self.draw_edges(edges=self.show_edges, color=self.edgecolor, group=self.group)
+            self._guids += self.draw_edges(edges=self.show_edges, color=self.edgecolor)
+
+        if self.group:
+            self.add_to_group(self.group, self._guids)
 
         return self.guids
 
@@ -2,13 +2,29 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+from collections import defaultdict
+from contextlib import contextmanager
+
 import scriptcontext as sc  # type: ignore
 import Rhino  # type: ignore
 import System  # type: ignore
 
 import compas_rhino.layers
 from compas.scene import SceneObject
+from .exceptions import RhinoGroupError
 from .helpers import ensure_layer
+from .helpers import find_layer_by_fullpath
+
+# RhinoDoc.RuntimeSerialNumber is not available in Rhino 5
+if hasattr(Rhino.RhinoDoc, "RuntimeSerialNumber"):
+
+    def _document_id():
+        return sc.doc.RuntimeSerialNumber
+
+else:
+
+    def _document_id():
+        return sc.doc.DocumentId
 
 
 class RhinoSceneObject(SceneObject):
@@ -26,12 +42,48 @@ class RhinoSceneObject(SceneObject):
 
     """
 
+    _batched_groups = False
+    _pending_group_adds = defaultdict(list)
+    _group_index = None
+    _batched_layers = False
+    _pending_layer_clears = set()
+    _doc_id = None
+    _async_flush = None
+
     def __init__(self, layer=None, group=None, **kwargs):
         super(RhinoSceneObject, self).__init__(**kwargs)
+        self._layer = None
+        self._layer_index = -1
         self.layer = layer
         self.group = group
 
-    def get_group(self, name):
+    @property
+    def layer(self):
+        return self._layer
+
+    @layer.setter
+    def layer(self, layer):
+        # the index of the layer is only resolved when it is needed
+        self._layer = layer
+        self._layer_index = -1
+
+    def _find_layer_index(self):
+        # the index of the layer is cached
+        # and only looked up by name again if the layer at that index no longer exists
+        # or no longer has the name of the layer of the scene object,
+        # for example because it was renamed or because the active document has changed
+        layers = sc.doc.Layers
+        index = self._layer_index
+        if index >= 0:
+            layer = layers.FindIndex(index)
+            if layer and not layer.IsDeleted and layer.FullPath == self.layer:
+                return index
+        index = layers.FindByFullPath(self.layer, -1) if find_layer_by_fullpath else -1
+        self._layer_index = index
+        return index
+
+    @classmethod
+    def get_group(cls, name):
         """Find the group with the given name, or create a new one.
 
         Parameters
@@ -43,12 +95,49 @@ class RhinoSceneObject(SceneObject):
         -------
         :rhino:`Rhino.DocObjects.Group`
 
+        Raises
+        ------
+        RhinoGroupError
+            If the group does not exist and cannot be added.
+
+        Notes
+        -----
+        The first time a group is requested in a document,
+        the names of all groups are mapped to their indices in a single pass over the group table.
+        Afterwards, groups are retrieved by index.
+        The table is only searched by name if a group could not be added because its name is already taken.
+
         """
-        group = sc.doc.Groups.FindName(name)
-        if not group:
-            if sc.doc.Groups.Add(name) < 0:
-                raise Exception("Failed to add group: {}".format(name))
-            group = sc.doc.Groups.FindName(name)
+        # the group index belongs to a single document
+        # and is discarded if the active document changes
+        doc_id = _document_id()
+        if RhinoSceneObject._doc_id != doc_id:
+            RhinoSceneObject._doc_id = doc_id
+            RhinoSceneObject._group_index = None
+        groups = sc.doc.Groups
+        group_index = RhinoSceneObject._group_index
+        if group_index is None:
+            group_index = RhinoSceneObject._group_index = {}
+            for index in range(groups.Count):
+                group = groups.FindIndex(index)
+                if group and not group.IsDeleted:
+                    group_index[group.Name] = index
+        index = group_index.get(name)
+        if index is not None:
+            group = groups.FindIndex(index)
+            if group and not group.IsDeleted and group.Name == name:
+                return group
+        # adding fails if a group with the same name exists already
+        # for example, if it was created after the group index was built
+        index = groups.Add(name)
+        if index < 0:
+            group = groups.FindName(name)
+            if not group:
+                raise RhinoGroupError(name)
+            index = group.Index
+        else:
+            group = groups.FindIndex(index)
+        group_index[name] = index
         return group
 
     def add_to_group(self, name, guids):
@@ -58,17 +147,90 @@ class RhinoSceneObject(SceneObject):
         ----------
         name : str
             The name of the group.
-        guids : list[System.Guid]
-            A list of GUIDs.
+        guids : iterable[System.Guid]
+            The GUIDs of the objects.
 
         Returns
         -------
         None
 
+        Notes
+        -----
+        If there are no GUIDs, nothing happens, and the group is not created.
+        Inside a :meth:`batched_groups` context, the GUIDs are collected per group
+        and only added to the group when the context is exited.
+
+        """
+        guids = tuple(guids)
+        if not guids:
+            return
+        if RhinoSceneObject._batched_groups:
+            RhinoSceneObject._pending_group_adds[name].extend(guids)
+            return
+        self._add_to_groups({name: guids})
+
+    @classmethod
+    def flush_group_adds(cls):
+        """Add all GUIDs collected by :meth:`add_to_group` during batching to their groups.
+
+        Every group is resolved only once,
+        and the GUIDs of a group are added with one call to the group table per chunk of 1024 GUIDs.
+
+        Returns
+        -------
+        None
+
+        """
+        pending = RhinoSceneObject._pending_group_adds
+        RhinoSceneObject._pending_group_adds = defaultdict(list)
+        cls._add_to_groups(pending)
+
+    @classmethod
+    def _add_to_groups(cls, pending):
+        # the guids are added in chunks of limited size
+        # to bound the size of the arrays passed to Rhino per call
+        groups = sc.doc.Groups
+        n = compas_rhino.layers.CHUNK_SIZE
+        for name in pending:
+            group = cls.get_group(name)
+            if group:
+                guids = pending[name]
+                for i in range(0, len(guids), n):
+                    groups.AddToGroup(group.Index, System.Array[System.Guid](guids[i : i + n]))
+
+    @classmethod
+    @contextmanager
+    def batched_groups(cls):
+        """Create a context in which group assignments of all scene objects are deferred.
+
+        Yields
+        ------
+        None
+
+        Notes
+        -----
+        When the context is exited, the collected assignments are flushed with :meth:`flush_group_adds`,
+        even if an error occurred while drawing.
+        Nested contexts are flushed only when the outermost context is exited.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            with RhinoSceneObject.batched_groups():
+                for sceneobject in scene.objects:
+                    sceneobject.draw()
+
         """
-        group = self.get_group(name)
-        if group:
-            sc.doc.Groups.AddToGroup(group.Index, guids)
+        if RhinoSceneObject._batched_groups:
+            yield
+            return
+        RhinoSceneObject._batched_groups = True
+        try:
+            yield
+        finally:
+            RhinoSceneObject._batched_groups = False
+            cls.flush_group_adds()
 
     def clear_layer(self):
         """Clear the layer of the scene object.
@@ -77,9 +239,234 @@ class RhinoSceneObject(SceneObject):
         -------
         None
 
+        Notes
+        -----
+        Inside a :meth:`batched` context, the layer is only marked for clearing.
+        All marked layers are cleared together before the next object is added to the document,
+        and when the context is exited.
+
         """
         if self.layer:
-            compas_rhino.layers.clear_layer(self.layer)
+            if RhinoSceneObject._batched_layers:
+                RhinoSceneObject._pending_layer_clears.add(self.layer)
+                return
+            index = self._find_layer_index()
+            if index >= 0:
+                compas_rhino.layers.clear_layer_by_index(index)
+            elif not find_layer_by_fullpath:
+                compas_rhino.layers.clear_layer(self.layer)
+
+    @classmethod
+    def flush_layer_clears(cls):
+        """Clear all layers marked for clearing by :meth:`clear_layer` during batching.
+
+        The objects of all layers are collected first and then deleted in one pass.
+
+        Returns
+        -------
+        None
+
+        """
+        layers = RhinoSceneObject._pending_layer_clears
+        if not layers:
+            return
+        RhinoSceneObject._pending_layer_clears = set()
+        cls._clear_layers(layers)
+
+    @classmethod
+    def _clear_layers(cls, layers):
+        # layers are cleared including their sublayers
+        # therefore layers nested in other marked layers can be skipped
+        roots = []
+        for layer in layers:
+            parts = layer.split("::")
+            if not any("::".join(parts[:i]) in layers for i in range(1, len(parts))):
+                roots.append(layer)
+        if not find_layer_by_fullpath:
+            compas_rhino.layers.clear_layers(roots)
+            return
+        # the objects are collected per layer index with an object enumerator
+        # instead of searching all hidden objects of the document for every layer
+        layer_table = sc.doc.Layers
+        indices = [layer_table.FindByFullPath(layer, -1) for layer in roots]
+        compas_rhino.layers.clear_layers_by_index([index for index in indices if index >= 0])
+
+    @classmethod
+    @contextmanager
+    def batched(cls):
+        """Create a context in which layer clearing and group assignments of all scene objects are deferred.
+
+        Yields
+        ------
+        None
+
+        Notes
+        -----
+        Layers are cleared with :meth:`flush_layer_clears` before the first object is drawn after clearing,
+        which coalesces consecutive calls to :meth:`clear_layer` into a single deletion pass.
+        Group assignments are deferred as in :meth:`batched_groups`.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            with RhinoSceneObject.batched():
+                for sceneobject in sceneobjects:
+                    sceneobject.clear_layer()
+                for sceneobject in sceneobjects:
+                    sceneobject.draw()
+
+        """
+        if RhinoSceneObject._batched_layers:
+            yield
+            return
+        RhinoSceneObject._batched_layers = True
+        try:
+            with cls.batched_groups():
+                yield
+        finally:
+            RhinoSceneObject._batched_layers = False
+            cls.flush_layer_clears()
+
+    @classmethod
+    @contextmanager
+    def bulk_draw(cls):
+        """Create a context for drawing many scene objects as a single operation in the document.
+
+        Yields
+        ------
+        None
+
+        Notes
+        -----
+        Redrawing of the views is disabled for the duration of the context,
+        and all changes to the document are recorded in a single undo record.
+        Layer clearing and group assignments are deferred as in :meth:`batched`.
+        When the context is exited, the deferred operations are flushed,
+        the previous redraw state is restored, and the views are redrawn once.
+
+        :attr:`Rhino.RhinoDoc.Views.RedrawEnabled` stays ``False`` for the entire context,
+        including while the deferred layer clears are flushed,
+        because the layer and object deletion helpers of :mod:`compas_rhino`
+        only re-enable redrawing if it was enabled when they were called.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            with RhinoSceneObject.bulk_draw():
+                for sceneobject in sceneobjects:
+                    sceneobject.clear_layer()
+                    sceneobject.draw()
+
+        """
+        redraw = sc.doc.Views.RedrawEnabled
+        sc.doc.Views.RedrawEnabled = False
+        record = sc.doc.BeginUndoRecord("COMPAS")
+        try:
+            with cls.batched():
+                yield
+        finally:
+            if record:
+                sc.doc.EndUndoRecord(record)
+            sc.doc.Views.RedrawEnabled = redraw
+            if redraw:
+                sc.doc.Views.Redraw()
+
+    @classmethod
+    def flush_async(cls):
+        """Flush the deferred layer clears and group assignments the next time Rhino is idle.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        The currently deferred operations are taken over by a one-shot handler of :rhino:`Rhino.RhinoApp.Idle`,
+        and the calling code can continue immediately.
+        Operations that are deferred afterwards are not included.
+        Layers still waiting to be cleared are cleared before the next object is added to the document.
+
+        See Also
+        --------
+        :meth:`await_flush`
+
+        """
+        cls.await_flush()
+        layers = RhinoSceneObject._pending_layer_clears
+        pending = RhinoSceneObject._pending_group_adds
+        if not layers and not pending:
+            return
+        RhinoSceneObject._pending_layer_clears = set()
+        RhinoSceneObject._pending_group_adds = defaultdict(list)
+
+        def flush(sender, e):
+            Rhino.RhinoApp.Idle -= handler
+            RhinoSceneObject._async_flush = None
+            cls._add_to_groups(pending)
+            if layers:
+                cls._clear_layers(layers)
+
+        handler = System.EventHandler(flush)
+        RhinoSceneObject._async_flush = handler, layers
+        Rhino.RhinoApp.Idle += handler
+
+    @classmethod
+    def await_flush(cls):
+        """Complete a flush started with :meth:`flush_async` that has not been performed yet.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        If Rhino has not been idle since the flush was started, the deferred operations are performed immediately.
+
+        """
+        if RhinoSceneObject._async_flush:
+            handler = RhinoSceneObject._async_flush[0]
+            handler.Invoke(None, System.EventArgs.Empty)
+
+    @classmethod
+    def draw_batch(cls, sceneobjects):
+        """Clear the layers of multiple scene objects and draw them in a single bulk operation.
+
+        Parameters
+        ----------
+        sceneobjects : list[:class:`RhinoSceneObject`]
+            The scene objects.
+
+        Returns
+        -------
+        list[System.Guid]
+            The GUIDs of the created Rhino objects.
+
+        Notes
+        -----
+        The operation is performed in two passes inside a :meth:`bulk_draw` context.
+        First, the layers of all scene objects are cleared in a single deletion pass.
+        Then, the scene objects with ``show`` enabled are drawn,
+        and the objects are added to their groups when the context is exited.
+        Groups are only resolved or created for objects that are actually drawn.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            guids = RhinoSceneObject.draw_batch(scene.objects)
+
+        """
+        guids = []
+        with cls.bulk_draw():
+            for sceneobject in sceneobjects:
+                sceneobject.clear_layer()
+            cls.flush_layer_clears()
+            for sceneobject in sceneobjects:
+                if sceneobject.show:
+                    guids += sceneobject.draw()
+        return guids
 
     def compile_attributes(self, name=None, color=None, arrow=None):
         """Compile Rhino DocObject Attributes.
@@ -98,6 +485,11 @@ class RhinoSceneObject(SceneObject):
         :rhino:`Rhino.DocObjects.ObjectAttributes`
 
         """
+        if RhinoSceneObject._pending_layer_clears:
+            self.flush_layer_clears()
+        if RhinoSceneObject._async_flush and RhinoSceneObject._async_flush[1]:
+            self.await_flush()
+
         name = name or self.item.name
         color = color or self.color
 
@@ -111,7 +503,14 @@ class RhinoSceneObject(SceneObject):
             attributes.ColorSource = Rhino.DocObjects.ObjectColorSource.ColorFromObject
 
         if self.layer:
-            attributes.LayerIndex = ensure_layer(self.layer)
+            index = self._find_layer_index()
+            if index < 0:
+                index = ensure_layer(self.layer)
+                # without a lookup by full path, the index is a placeholder
+                # which should not be used to clear the layer
+                if find_layer_by_fullpath:
+                    self._layer_index = index
+            attributes.LayerIndex = index
 
         if arrow:
             if arrow == "end":
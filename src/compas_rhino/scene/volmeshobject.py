@@ -146,13 +146,16 @@ class RhinoVolMeshObject(RhinoSceneObject, VolMeshObject):
         guids = []
 
         if self.show_vertices:
-            guids += self.draw_vertices(vertices=self.show_vertices, color=self.vertexcolor, group=self.group)
+            guids += self.draw_vertices(vertices=self.show_vertices, color=self.vertexcolor)
         if self.show_edges:
-            guids += self.draw_edges(edges=self.show_edges, color=self.edgecolor, group=self.group)
+            guids += self.draw_edges(edges=self.show_edges, color=self.edgecolor)
         if self.show_faces:
-            guids += self.draw_faces(faces=self.show_faces, color=self.facecolor, group=self.group)
+            guids += self.draw_faces(faces=self.show_faces, color=self.facecolor)
         if self.show_cells:
-            guids += self.draw_cells(cells=self.show_cells, color=self.cellcolor, group=self.group)
+            guids += self.draw_cells(cells=self.show_cells, color=self.cellcolor)
+
+        if self.group:
+            self.add_to_group(self.group, guids)
 
         self._guids = guids
 
@@ -68,3 +68,13 @@ def test_color_predefined():
     assert Color.navy() == Color(0.0, 0.0, 0.5)
     assert Color.maroon() == Color(0.5, 0.0, 0.0)
     assert Color.silver() == Color(0.75, 0.75, 0.75)
+
+
+def test_color_coerce():
+    color = Color(0.1, 0.2, 0.3, alpha=0.5)
+    assert Color.coerce(color) is color
+
+    assert Color.coerce((255, 0, 0)) == Color.red()
+    assert Color.coerce((0.0, 1.0, 0.0)) == Color.green()
+    assert Color.coerce("#0000ff") == Color.blue()
+    assert Color.coerce(None) is None
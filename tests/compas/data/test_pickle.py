@@ -11,3 +11,12 @@ def test_pickling():
     assert all(a == b for a, b in zip(f1.yaxis, f2.yaxis))
     assert all(a == b for a, b in zip(f1.zaxis, f2.zaxis))
     assert f1.guid == f2.guid
+
+
+def test_pickling_slots():
+    from compas.geometry import Quaternion
+
+    q1 = Quaternion(1.0, 2.0, 3.0, 4.0)
+    q2 = pickle.loads(pickle.dumps(q1, protocol=pickle.HIGHEST_PROTOCOL))
+    assert q1.wxyz == q2.wxyz
+    assert q1.guid == q2.guid
@@ -180,6 +180,33 @@ def test_arc_geometry():
     pass
 
 
+def test_arc_cached_properties(frame):
+    arc = Arc(radius=1.0, start_angle=0.0, end_angle=math.pi)
+
+    assert close(arc.angle, math.pi)
+    assert close(arc.length, math.pi)
+    assert close(arc.circumference, 2.0 * math.pi)
+
+    arc.radius = 2.0
+    assert close(arc.length, 2.0 * math.pi)
+    assert close(arc.circumference, 4.0 * math.pi)
+    assert close(arc.circle.radius, 2.0)
+
+    arc.start_angle = 0.5 * math.pi
+    assert close(arc.angle, 0.5 * math.pi)
+    assert close(arc.length, math.pi)
+
+    arc.end_angle = 1.5 * math.pi
+    assert close(arc.angle, math.pi)
+    assert close(arc.length, 2.0 * math.pi)
+
+    arc.frame = frame
+    assert allclose(arc.circle.frame.point, frame.point)
+
+    arc.frame.point = [5.0, 5.0, 5.0]
+    assert allclose(arc.circle.frame.point, [5.0, 5.0, 5.0])
+
+
 # =============================================================================
 # Accessors
 # =============================================================================
@@ -191,3 +218,65 @@ def test_arc_geometry():
 # =============================================================================
 # Other Methods
 # =============================================================================
+
+
+def test_arc_points_at(frame):
+    if compas.IPY:
+        return
+
+    arc = Arc(radius=0.2, start_angle=0.3, end_angle=2.14, frame=frame)
+    params = [0.0, 0.25, 0.5, 0.75, 1.0]
+
+    points = arc.points_at(params)
+    assert points.shape == (5, 3)
+    for t, point in zip(params, points):
+        assert allclose(point, arc.point_at(t), tol=1e-12)
+
+    points = arc.points_at(params, world=False)
+    for t, point in zip(params, points):
+        assert allclose(point, arc.point_at(t, world=False), tol=1e-12)
+
+    with pytest.raises(ValueError):
+        arc.points_at([0.5, 1.1])
+
+
+def test_arc_points_at_after_frame_change(frame):
+    if compas.IPY:
+        return
+
+    from compas.geometry import Rotation
+
+    arc = Arc(radius=0.2, start_angle=0.3, end_angle=2.14)
+    assert allclose(arc.points_at([0.5])[0], arc.point_at(0.5), tol=1e-12)
+
+    arc.frame = frame
+    assert allclose(arc.points_at([0.5])[0], arc.point_at(0.5), tol=1e-12)
+
+    arc.transform(Rotation.from_axis_and_angle([0.0, 1.0, 0.0], 0.7))
+    assert allclose(arc.points_at([0.5])[0], arc.point_at(0.5), tol=1e-12)
+
+    arc.frame.point = [5.0, 5.0, 5.0]
+    assert allclose(arc.points_at([0.5])[0], arc.point_at(0.5), tol=1e-12)
+
+
+def test_arc_points_at_kernel(frame):
+    if compas.IPY:
+        return
+
+    from numpy import asarray
+    from numpy import column_stack
+    from compas.geometry.curves._arc_numba import _arc_points
+
+    arc = Arc(radius=0.2, start_angle=0.3, end_angle=2.14, frame=frame)
+    params = [0.0, 0.25, 0.5, 0.75, 1.0]
+
+    # the kernel compiled with numba is plain python without it
+    R = column_stack((arc.frame.xaxis, arc.frame.yaxis, arc.frame.zaxis))
+    t = asarray(arc.frame.point, dtype=float)
+    points = _arc_points(asarray(params, dtype=float), arc.start_angle, arc.angle, arc.radius, R, t)
+    assert allclose(points.tolist(), arc.points_at(params).tolist(), tol=1e-12)
+
+    points = arc.points_at(0.5)
+    assert points.shape == (1, 3)
+    assert allclose(points[0], arc.point_at(0.5), tol=1e-12)
+    assert arc.points_at(0.5, world=False).shape == (1, 3)
@@ -82,3 +82,92 @@ def test_quaternion_data():
 # =============================================================================
 # Other Methods
 # =============================================================================
+
+
+def test_quaternion_multiply():
+    from compas.geometry import quaternion_multiply
+    from compas.geometry import allclose
+
+    r = Quaternion(random(), random(), random(), random())
+    q = Quaternion(random(), random(), random(), random())
+
+    p = r * q
+    assert isinstance(p, Quaternion)
+    assert allclose(p, quaternion_multiply(r.wxyz, q.wxyz), tol=1e-12)
+    assert allclose(r * q.wxyz, p, tol=1e-12)
+
+
+def test_quaternion_unary_methods():
+    from compas.geometry import quaternion_norm
+    from compas.geometry import quaternion_unitize
+    from compas.geometry import quaternion_canonize
+    from compas.geometry import quaternion_conjugate
+    from compas.geometry import allclose
+
+    q = Quaternion(-random(), random(), -random(), random())
+
+    assert close(q.norm, quaternion_norm(q.wxyz), tol=1e-12)
+    assert q.unitized().is_unit
+    assert allclose(q.unitized(), quaternion_unitize(q.wxyz), tol=1e-12)
+    assert allclose(q.canonized(), quaternion_canonize(q.wxyz), tol=1e-12)
+    assert allclose(q.conjugated(), quaternion_conjugate(q.wxyz), tol=1e-12)
+
+    p = q.copy()
+    p.canonize()
+    assert p.w >= 0.0
+    assert allclose(p, q.canonized(), tol=1e-12)
+
+    p = q.copy()
+    p.conjugate()
+    assert allclose(p, q.conjugated(), tol=1e-12)
+
+    p = q.copy()
+    p.unitize()
+    assert allclose(p, q.unitized(), tol=1e-12)
+
+    with pytest.raises(ValueError):
+        Quaternion(0.0, 0.0, 0.0, 0.0).unitized()
+
+
+def test_quaternion_canonize_non_negative_w():
+    from compas.geometry import allclose
+
+    for q in (Quaternion(random(), -random(), random(), -random()), Quaternion(0.0, 1.0, 0.0, 0.0)):
+        p = q.canonized()
+        assert p is not q
+        assert allclose(p, q, tol=1e-12)
+
+        p = q.copy()
+        p.canonize()
+        assert allclose(p, q, tol=1e-12)
+
+
+def test_quaternion_multiply_batch():
+    if compas.IPY:
+        return
+
+    from compas.geometry import allclose
+
+    A = [Quaternion(random(), random(), random(), random()) for _ in range(10)]
+    B = [Quaternion(random(), random(), random(), random()) for _ in range(10)]
+
+    P = Quaternion.multiply_batch([a.wxyz for a in A], [b.wxyz for b in B])
+    assert P.shape == (10, 4)
+    for a, b, p in zip(A, B, P):
+        assert allclose(p, a * b, tol=1e-12)
+
+
+def test_quaternion_unitize_batch():
+    if compas.IPY:
+        return
+
+    from compas.geometry import allclose
+
+    Q = [Quaternion(random(), random(), random(), random()) for _ in range(10)]
+
+    U = Quaternion.unitize_batch([q.wxyz for q in Q])
+    for q, u in zip(Q, U):
+        assert allclose(u, q.unitized(), tol=1e-12)
+
+    with pytest.raises(ValueError):
+        Quaternion.unitize_batch([[1.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0]])